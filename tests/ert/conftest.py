@@ -178,7 +178,7 @@ def _copy_case(path):
         shutil.copytree(
             os.path.join(source_root, "test-data/ert", path),
             tmp_path / "test_data",
-            ignore=shutil.ignore_patterns("storage", "poly_out"),
+            ignore=shutil.ignore_patterns("storage", "poly_out", "*.ipynb"),
         )
         monkeypatch.chdir(tmp_path / "test_data")
 
@@ -1,15 +1,12 @@
 import os
 import stat
 import sys
-import tempfile
 from multiprocessing import Process
-from pathlib import Path
 from textwrap import dedent
 
 import memray
 import numpy as np
 import polars as pl
-import py
 import pytest
 import xtgeo
 
@@ -17,18 +14,16 @@
 from ert.config import ErtConfig, ESSettings, UpdateSettings
 from ert.enkf_main import sample_prior
 from ert.mode_definitions import ENSEMBLE_SMOOTHER_MODE
-from ert.storage import open_storage
+from ert.storage import Storage, open_storage
 from tests.ert.performance_tests.performance_utils import make_poly_example
 from tests.ert.ui_tests.cli.run_cli import run_cli
 
 
 @pytest.fixture
-def poly_template(monkeypatch):
-    folder = py.path.local(tempfile.mkdtemp())
-    script_path = Path(__file__).parent.resolve()
+def poly_template(monkeypatch, tmp_path, source_root):
     folder = make_poly_example(
-        folder,
-        f"{script_path}/../../../test-data/ert/poly_template",
+        tmp_path,
+        source_root / "test-data" / "ert" / "poly_template",
         gen_data_count=34,
         gen_data_entries=15,
         summary_data_entries=100,
@@ -48,8 +43,8 @@ def poly_template(monkeypatch):
 
 def test_memory_smoothing(poly_template):
     ert_config = ErtConfig.from_file("poly.ert")
-    fill_storage_with_data(poly_template, ert_config)
     with open_storage(poly_template / "ensembles", mode="w") as storage:
+        fill_storage_with_data(storage, ert_config)
         experiment = storage.get_experiment_by_name("test-experiment")
         prior_ens = experiment.get_ensemble_by_name("prior")
         posterior_ens = storage.create_ensemble(
@@ -73,59 +68,71 @@ def test_memory_smoothing(poly_template):
     assert stats.peak_memory_allocated < 1024**2 * 300
 
 
-def fill_storage_with_data(poly_template: Path, ert_config: ErtConfig) -> None:
-    path = Path(poly_template) / "ensembles"
-    with open_storage(path, mode="w") as storage:
-        ens_config = ert_config.ensemble_config
-        experiment_id = storage.create_experiment(
-            parameters=ens_config.parameter_configuration,
-            responses=ens_config.response_configuration,
-            observations=ert_config.observations,
-            name="test-experiment",
+def fill_storage_with_data(storage: Storage, ert_config: ErtConfig) -> None:
+    ens_config = ert_config.ensemble_config
+    experiment_id = storage.create_experiment(
+        parameters=ens_config.parameter_configuration,
+        responses=ens_config.response_configuration,
+        observations=ert_config.observations,
+        name="test-experiment",
+    )
+    source = storage.create_ensemble(experiment_id, name="prior", ensemble_size=100)
+
+    rng = np.random.default_rng()
+    realizations = list(range(ert_config.runpath_config.num_realizations))
+    gendatas = []
+    gen_obs = ert_config.observations["gen_data"]
+    for response_key, df in gen_obs.group_by("response_key"):
+        gendata_df = make_gen_data(rng, df["index"].max() + 1)
+        gendata_df = gendata_df.insert_column(
+            0,
+            pl.Series(np.full(len(gendata_df), response_key)).alias("response_key"),
         )
-        source = storage.create_ensemble(experiment_id, name="prior", ensemble_size=100)
-
-        realizations = list(range(ert_config.runpath_config.num_realizations))
-        for real in realizations:
-            gendatas = []
-            gen_obs = ert_config.observations["gen_data"]
-            for response_key, df in gen_obs.group_by("response_key"):
-                gendata_df = make_gen_data(df["index"].max() + 1)
-                gendata_df = gendata_df.insert_column(
-                    0,
-                    pl.Series(np.full(len(gendata_df), response_key)).alias(
-                        "response_key"
-                    ),
-                )
-                gendatas.append(gendata_df)
-
-            source.save_response("gen_data", pl.concat(gendatas), real)
-
-            obs_time_list = ens_config.refcase.all_dates
-
-            summary_keys = ert_config.observations["summary"]["response_key"].unique(
-                maintain_order=True
-            )
+        gendatas.append(gendata_df)
+    gen_data = pl.concat(gendatas)
 
-            source.save_response(
-                "summary",
-                make_summary_data(summary_keys, obs_time_list),
-                real,
-            )
+    obs_time_list = ens_config.refcase.all_dates
+    summary_keys = ert_config.observations["summary"]["response_key"].unique(
+        maintain_order=True
+    )
+    summary_data = make_summary_data(rng, summary_keys, obs_time_list)
+
+    # The keys and indices are the same for all realizations, only draw
+    # new values for each of them
+    for real in realizations:
+        source.save_response(
+            "gen_data",
+            gen_data.with_columns(values=random_values(rng, len(gen_data))),
+            real,
+        )
+        source.save_response(
+            "summary",
+            summary_data.with_columns(values=random_values(rng, len(summary_data))),
+            real,
+        )
 
-        sample_prior(source, realizations, ens_config.parameters)
+    sample_prior(source, realizations, ens_config.parameters)
 
-        storage.create_ensemble(
-            source.experiment_id,
-            ensemble_size=source.ensemble_size,
-            iteration=1,
-            name="target_ens",
-            prior_ensemble=source,
-        )
+    storage.create_ensemble(
+        source.experiment_id,
+        ensemble_size=source.ensemble_size,
+        iteration=1,
+        name="target_ens",
+        prior_ensemble=source,
+    )
 
 
-def make_gen_data(obs: int, min_val: float = 0, max_val: float = 5) -> pl.DataFrame:
-    data = np.random.default_rng().uniform(min_val, max_val, obs)
+def random_values(
+    rng: np.random.Generator, size: int, min_val: float = 0, max_val: float = 5
+) -> pl.Series:
+    # Responses are stored as Float32, as when read from the forward model
+    return pl.Series(rng.uniform(min_val, max_val, size), dtype=pl.Float32)
+
+
+def make_gen_data(
+    rng: np.random.Generator, obs: int, min_val: float = 0, max_val: float = 5
+) -> pl.DataFrame:
+    data = random_values(rng, obs, min_val, max_val)
     return pl.DataFrame(
         {
             "report_step": pl.Series(np.full(len(data), 0), dtype=pl.UInt16),
@@ -136,12 +143,13 @@ def make_gen_data(obs: int, min_val: float = 0, max_val: float = 5) -> pl.DataFr
 
 
 def make_summary_data(
+    rng: np.random.Generator,
     obs_keys: list[str],
     dates,
     min_val: float = 0,
     max_val: float = 5,
 ) -> pl.DataFrame:
-    data = np.random.default_rng().uniform(min_val, max_val, len(obs_keys) * len(dates))
+    data = random_values(rng, len(obs_keys) * len(dates), min_val, max_val)
 
     return pl.DataFrame(
         {
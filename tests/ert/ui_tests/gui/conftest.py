@@ -5,7 +5,7 @@
 import shutil
 import stat
 import time
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from textwrap import dedent
@@ -13,7 +13,7 @@
 from unittest.mock import MagicMock, Mock
 
 import pytest
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import QElapsedTimer, Qt, QTimer
 from PyQt6.QtWidgets import (
     QApplication,
     QComboBox,
@@ -43,6 +43,13 @@
 )
 
 
+def gui_args(config_path) -> Mock:
+    """Stand-in for the parsed command line arguments of `ert gui config_path`"""
+    args = Mock()
+    args.config = str(config_path)
+    return args
+
+
 def open_gui_with_config(config_path) -> Iterator[ErtMainWindow]:
     with (
         _open_main_window(config_path) as (
@@ -68,6 +75,7 @@ def _new_poly_example(source_root, destination, num_realizations: int = 20):
         os.path.join(source_root, "test-data", "ert", "poly_example"),
         destination,
         dirs_exist_ok=True,
+        ignore=shutil.ignore_patterns("storage", "poly_out", "*.ipynb"),
     )
 
     with fileinput.input(destination / "poly.ert", inplace=True) as fin:
@@ -82,8 +90,7 @@ def _new_poly_example(source_root, destination, num_realizations: int = 20):
 
 @contextmanager
 def _open_main_window(path) -> Iterator[tuple[ErtMainWindow, Storage, ErtConfig]]:
-    args_mock = Mock()
-    args_mock.config = str(path)
+    args_mock = gui_args(path)
     with ErtPluginContext():
         config = ErtConfig.with_plugins().from_file(path)
         with (
@@ -259,9 +266,7 @@ def handle_dialog():
             # The Run dialog opens, click show details and wait until done appears
             # then click it
             run_dialog = wait_for_child(gui, qtbot, RunDialog, timeout=10000)
-            qtbot.waitUntil(
-                lambda: run_dialog.is_simulation_done() is True, timeout=200000
-            )
+            wait_for_simulation_done(qtbot, run_dialog, timeout=200000)
             qtbot.waitUntil(lambda: run_dialog._tab_widget.currentWidget() is not None)
 
             # Assert that the number of boxes in the detailed view is
@@ -397,6 +402,44 @@ def wait_for_child(gui, qtbot: QtBot, typ: type[V], timeout=5000, **kwargs) -> V
     return get_child(gui, typ, **kwargs)
 
 
+def handle_when_shown(
+    gui: QWidget,
+    typ: type[V],
+    handler: Callable[[V], None],
+    timeout: int = 5000,
+    interval: int = 100,
+) -> None:
+    """Call handler with the first child of type typ as soon as it exists.
+
+    Unlike wait_for_child this does not block while waiting, so it can be set up
+    right before an action that opens a modal dialog. Polling stops when gui is
+    destroyed, and fails the running test if no child is shown within timeout ms.
+    """
+    timer = QTimer(gui)
+    elapsed = QElapsedTimer()
+
+    def poll() -> None:
+        child = gui.findChild(typ)
+        if child is None and not elapsed.hasExpired(timeout):
+            return
+        timer.stop()
+        timer.deleteLater()
+        if child is None:
+            raise AssertionError(f"No {typ.__name__} was shown within {timeout} ms")
+        handler(child)
+
+    timer.timeout.connect(poll)
+    elapsed.start()
+    timer.start(interval)
+
+
+def wait_for_simulation_done(qtbot: QtBot, run_dialog: RunDialog, timeout=5000):
+    """Block until the run dialog emits simulation_done, unless it already has"""
+    if not run_dialog.is_simulation_done():
+        with qtbot.waitSignal(run_dialog.simulation_done, timeout=timeout):
+            pass
+
+
 def get_child(gui: QWidget, typ: type[V], *args, **kwargs) -> V:
     child = gui.findChild(typ, *args, **kwargs)
     assert isinstance(child, typ)
@@ -406,3 +449,8 @@ def get_child(gui: QWidget, typ: type[V], *args, **kwargs) -> V:
 def get_children(gui: QWidget, typ: type[V], *args, **kwargs) -> list[V]:
     children: list[typ] = gui.findChildren(typ, *args, **kwargs)
     return children
+
+
+def combo_items_enabled(combo_box: QComboBox) -> list[bool]:
+    model = combo_box.model()
+    return [model.item(i).isEnabled() for i in range(combo_box.count())]
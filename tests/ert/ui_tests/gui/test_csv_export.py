@@ -17,7 +17,12 @@
 from ert.run_models import EnsembleExperiment
 from ert.storage import open_storage
 
-from .conftest import get_child, wait_for_child
+from .conftest import (
+    get_child,
+    handle_when_shown,
+    wait_for_child,
+    wait_for_simulation_done,
+)
 
 
 def export_data(gui, qtbot, ensemble_select):
@@ -39,19 +44,18 @@ def handle_export_dialog():
 
         qtbot.mouseClick(export_dialog.ok_button, Qt.MouseButton.LeftButton)
 
-    def handle_finished_box():
+    def handle_finished_box(finished_message):
         """
         Click on the plugin finished dialog once it pops up
         """
-        finished_message = wait_for_child(gui, qtbot, QMessageBox)
         assert "completed" in finished_message.text()
         qtbot.mouseClick(
             finished_message.button(QMessageBox.StandardButton.Ok),
             Qt.MouseButton.LeftButton,
         )
 
-    QTimer.singleShot(500, handle_export_dialog)
-    QTimer.singleShot(3000, handle_finished_box)
+    QTimer.singleShot(0, handle_export_dialog)
+    handle_when_shown(gui, QMessageBox, handle_finished_box)
     gui.export_tool.trigger()
 
     assert file_name == export_path
@@ -65,12 +69,12 @@ def verify_exported_content(file_name, gui, ensemble_select):
     ensemble_names = [ensemble_select]
     if ensemble_select == "*":
         ensemble_names = [e.name for e in gui.notifier.storage.ensembles]
+    facade = LibresFacade(gui.ert_config)
     for name in ensemble_names:
         experiment = gui.notifier.storage.get_experiment_by_name("es_mda")
         ensemble = experiment.get_ensemble_by_name(name)
         gen_kw_data = ensemble.load_all_gen_kw_data()
 
-        facade = LibresFacade.from_config_file("poly.ert")
         misfit_data = facade.load_all_misfit_data(ensemble)
 
         for i in range(ensemble.ensemble_size):
@@ -103,7 +107,7 @@ def run_experiment_via_gui(gui, qtbot):
     qtbot.mouseClick(run_experiment, Qt.MouseButton.LeftButton)
 
     run_dialog = wait_for_child(gui, qtbot, RunDialog)
-    qtbot.waitUntil(lambda: run_dialog.is_simulation_done() is True, timeout=20000)
+    wait_for_simulation_done(qtbot, run_dialog, timeout=20000)
     qtbot.waitUntil(lambda: run_dialog._tab_widget.currentWidget() is not None)
 
 
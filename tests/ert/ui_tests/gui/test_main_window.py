@@ -4,9 +4,8 @@
 import stat
 from pathlib import Path
 from textwrap import dedent
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, patch
 
-import numpy as np
 import pytest
 from PyQt6.QtCore import Qt, QTimer
 from PyQt6.QtGui import QAction
@@ -20,7 +19,6 @@
     QTreeView,
     QWidget,
 )
-from xtgeo import RegularSurface
 
 import ert.gui
 from ert.config import ErtConfig
@@ -61,18 +59,74 @@
 
 from ...unit_tests.gui.simulation.test_run_path_dialog import handle_run_path_dialog
 from .conftest import (
+    _new_poly_example,
     add_experiment_manually,
+    combo_items_enabled,
     get_child,
     get_children,
+    gui_args,
+    handle_when_shown,
     load_results_manually,
     wait_for_child,
+    wait_for_simulation_done,
 )
 
 
+@pytest.fixture(scope="module")
+def log_handler():
+    with add_gui_log_handler() as handler:
+        yield handler
+
+
+@pytest.fixture
+def start_gui(qtbot):
+    """Opens the initial window like ert gui does, and registers it with
+    qtbot so that it is closed and deleted when the test finishes."""
+
+    def _start_gui(*args, **kwargs):
+        gui, *rest = ert.gui.main._start_initial_gui_window(*args, **kwargs)
+        qtbot.addWidget(gui)
+        return gui, *rest
+
+    return _start_gui
+
+
+@pytest.fixture(scope="module")
+def _shared_poly_main_window(qapp, source_root, tmp_path_factory, log_handler):
+    path = tmp_path_factory.mktemp("poly_main_window")
+    _new_poly_example(source_root, path)
+    args = gui_args(path / "poly.ert")
+    # ert changes into the config directory while loading it, so restore
+    # the working directory once the window has been created
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(path)
+        gui, *_ = ert.gui.main._start_initial_gui_window(args, log_handler)
+    yield gui
+    gui.close()
+
+
+@pytest.fixture
+def poly_main_window(_shared_poly_main_window):
+    """Main window opened on the poly example, shared by the tests in this
+    module that only inspect it. The selected experiment type and the ES-MDA
+    weights are put back after each test, anything else a test changes is
+    seen by the tests that run after it. The working directory is not the
+    project directory of the window."""
+    gui = _shared_poly_main_window
+    combo_box = get_child(gui, QComboBox, name="experiment_type")
+    weights_box = get_child(
+        gui, QWidget, name="ES_MDA_panel"
+    )._relative_iteration_weights_box
+    experiment_index = combo_box.currentIndex()
+    weights = weights_box.text()
+    yield gui
+    weights_box.setText(weights)
+    combo_box.setCurrentIndex(experiment_index)
+
+
 @pytest.mark.usefixtures("set_site_config")
-@pytest.mark.parametrize(
-    "config, expected_message_types",
-    [
+def test_both_errors_and_warning_can_be_shown_in_suggestor(tmp_path, start_gui):
+    cases = [
         (
             "NUM_REALIZATIONS 1\n"
             "INSTALL_JOB job job\n"
@@ -82,95 +136,75 @@
         ),
         ("NUM_REALIZATIONS you_cant_do_this\n", ["Error"]),
         ("NUM_REALIZATIONS 1\n UMASK 0222\n", ["Deprecation"]),
-    ],
-)
-def test_both_errors_and_warning_can_be_shown_in_suggestor(
-    qapp, tmp_path, config, expected_message_types
-):
+    ]
     config_file = tmp_path / "config.ert"
     job_file = tmp_path / "job"
     job_file.write_text("EXECUTABLE echo\n")
-    config_file.write_text(config)
-
-    args = Mock()
-    args.config = str(config_file)
-    with add_gui_log_handler() as log_handler:
-        gui, *_ = ert.gui.main._start_initial_gui_window(args, log_handler)
-        assert isinstance(gui, Suggestor)
-        suggestions = gui.findChildren(SuggestorMessage)
-        shown_messages = [elem.lbl.text() for elem in suggestions]
-        assert all(
-            e in m for m, e in zip(shown_messages, expected_message_types, strict=False)
-        )
 
+    for config, expected_message_types in cases:
+        config_file.write_text(config)
+        args = gui_args(config_file)
+        with add_gui_log_handler() as log_handler:
+            gui, *_ = start_gui(args, log_handler)
+            assert isinstance(gui, Suggestor)
+            suggestions = gui.findChildren(SuggestorMessage)
+            shown_messages = [elem.lbl.text() for elem in suggestions]
+            assert all(
+                e in m
+                for m, e in zip(shown_messages, expected_message_types, strict=False)
+            ), config
+
+
+def test_that_the_ui_show_no_errors_and_enables_update_for_poly_example(
+    poly_main_window,
+):
+    gui = poly_main_window
+    combo_box = get_child(gui, QComboBox, name="experiment_type")
+    assert combo_box.count() == 6
 
-@pytest.mark.usefixtures("copy_poly_case")
-def test_that_the_ui_show_no_errors_and_enables_update_for_poly_example(qapp):
-    args = Mock()
-    args.config = "poly.ert"
-    with add_gui_log_handler() as log_handler:
-        gui, *_ = ert.gui.main._start_initial_gui_window(args, log_handler)
-        combo_box = get_child(gui, QComboBox, name="experiment_type")
-        assert combo_box.count() == 6
-
-        for i in range(combo_box.count()):
-            assert combo_box.model().item(i).isEnabled()
+    assert all(combo_items_enabled(combo_box))
 
-        assert gui.windowTitle().startswith("ERT - poly.ert")
+    assert gui.windowTitle().startswith("ERT - poly.ert")
 
 
 @pytest.mark.usefixtures("set_site_config")
 def test_gui_shows_a_warning_and_disables_update_when_there_are_no_observations(
-    qapp, tmp_path
+    tmp_path, log_handler, start_gui
 ):
     config_file = tmp_path / "config.ert"
     config_file.write_text("NUM_REALIZATIONS 1\n")
 
-    args = Mock()
-    args.config = str(config_file)
-    with add_gui_log_handler() as log_handler:
-        gui, *_ = ert.gui.main._start_initial_gui_window(args, log_handler)
-        combo_box = get_child(gui, QComboBox, name="experiment_type")
-        assert combo_box.count() == 6
+    args = gui_args(config_file)
+    gui, *_ = start_gui(args, log_handler)
+    combo_box = get_child(gui, QComboBox, name="experiment_type")
+    assert combo_box.count() == 6
 
-        for i in range(3):
-            assert combo_box.model().item(i).isEnabled()
-        for i in range(3, 5):
-            assert not combo_box.model().item(i).isEnabled()
+    assert combo_items_enabled(combo_box)[:5] == [True] * 3 + [False] * 2
 
-        assert gui.windowTitle().startswith("ERT - config.ert")
+    assert gui.windowTitle().startswith("ERT - config.ert")
 
 
 @pytest.mark.usefixtures("copy_poly_case")
 def test_gui_shows_a_warning_and_disables_update_when_parameters_are_missing(
-    qapp, tmp_path
+    tmp_path, log_handler, start_gui
 ):
-    with (
-        open("poly.ert", encoding="utf-8") as fin,
-        open("poly-no-gen-kw.ert", "w", encoding="utf-8") as fout,
-    ):
-        for line in fin:
-            if "GEN_KW" not in line:
-                fout.write(line)
-
-    args = Mock()
+    poly_lines = Path("poly.ert").read_text(encoding="utf-8").splitlines(keepends=True)
+    Path("poly-no-gen-kw.ert").write_text(
+        "".join(line for line in poly_lines if "GEN_KW" not in line), encoding="utf-8"
+    )
 
-    args.config = "poly-no-gen-kw.ert"
-    with add_gui_log_handler() as log_handler:
-        gui, *_ = ert.gui.main._start_initial_gui_window(args, log_handler)
-        combo_box = get_child(gui, QComboBox, name="experiment_type")
-        assert combo_box.count() == 6
+    args = gui_args("poly-no-gen-kw.ert")
+    gui, *_ = start_gui(args, log_handler)
+    combo_box = get_child(gui, QComboBox, name="experiment_type")
+    assert combo_box.count() == 6
 
-        for i in range(3):
-            assert combo_box.model().item(i).isEnabled()
-        for i in range(3, 5):
-            assert not combo_box.model().item(i).isEnabled()
+    assert combo_items_enabled(combo_box)[:5] == [True] * 3 + [False] * 2
 
-        assert gui.windowTitle().startswith("ERT - poly-no-gen-kw.ert")
+    assert gui.windowTitle().startswith("ERT - poly-no-gen-kw.ert")
 
 
 @pytest.mark.usefixtures("set_site_config")
-def test_help_buttons_in_suggester_dialog(tmp_path, qtbot):
+def test_help_buttons_in_suggester_dialog(tmp_path, qtbot, start_gui):
     """
     WHEN I am shown an error in the gui
     THEN the suggester gui comes up
@@ -181,12 +215,9 @@ def test_help_buttons_in_suggester_dialog(tmp_path, qtbot):
         "NUM_REALIZATIONS 1\n RUNPATH iens-%d/iter-%d\n", encoding="utf-8"
     )
 
-    args = Mock()
-    args.config = str(config_file)
+    args = gui_args(config_file)
     with add_gui_log_handler() as log_handler:
-        gui, *_ = ert.gui.main._start_initial_gui_window(
-            args, log_handler, ErtPluginManager()
-        )
+        gui, *_ = start_gui(args, log_handler, ErtPluginManager())
         assert isinstance(gui, Suggestor)
 
         with patch("webbrowser.open", MagicMock(return_value=True)) as browser_open:
@@ -195,18 +226,16 @@ def test_help_buttons_in_suggester_dialog(tmp_path, qtbot):
             assert browser_open.called
 
 
-@pytest.mark.usefixtures("copy_poly_case")
-def test_that_run_workflow_component_disabled_when_no_workflows(qapp):
-    args = Mock()
-    args.config = "poly.ert"
-    with add_gui_log_handler() as log_handler:
-        gui, *_ = ert.gui.main._start_initial_gui_window(args, log_handler)
-        assert gui.windowTitle().startswith("ERT - poly.ert")
-        assert not gui.workflows_tool.getAction().isEnabled()
+def test_that_run_workflow_component_disabled_when_no_workflows(poly_main_window):
+    gui = poly_main_window
+    assert gui.windowTitle().startswith("ERT - poly.ert")
+    assert not gui.workflows_tool.getAction().isEnabled()
 
 
 @pytest.mark.usefixtures("set_site_config")
-def test_that_run_workflow_component_enabled_when_workflows(qapp, tmp_path):
+def test_that_run_workflow_component_enabled_when_workflows(
+    tmp_path, log_handler, start_gui
+):
     config_file = tmp_path / "config.ert"
 
     with open(config_file, "a+", encoding="utf-8") as ert_file:
@@ -221,68 +250,58 @@ def test_that_run_workflow_component_enabled_when_workflows(qapp, tmp_path):
     with open(tmp_path / "workflows/UBER_PRINT", "w", encoding="utf-8") as f:
         f.write("EXECUTABLE ls\n")
 
-    args = Mock()
-    args.config = str(config_file)
+    args = gui_args(config_file)
 
-    with add_gui_log_handler() as log_handler:
-        gui, *_ = ert.gui.main._start_initial_gui_window(args, log_handler)
-        assert gui.windowTitle().startswith("ERT - config.ert")
-        assert gui.workflows_tool.getAction().isEnabled()
+    gui, *_ = start_gui(args, log_handler)
+    assert gui.windowTitle().startswith("ERT - config.ert")
+    assert gui.workflows_tool.getAction().isEnabled()
 
 
-@pytest.mark.usefixtures("copy_poly_case")
-def test_that_es_mda_is_disabled_when_weights_are_invalid(qtbot):
-    args = Mock()
-    args.config = "poly.ert"
-    with add_gui_log_handler() as log_handler:
-        gui, *_ = ert.gui.main._start_initial_gui_window(args, log_handler)
-        assert gui.windowTitle().startswith("ERT - poly.ert")
+def test_that_es_mda_is_disabled_when_weights_are_invalid(poly_main_window):
+    gui = poly_main_window
+    assert gui.windowTitle().startswith("ERT - poly.ert")
 
-        combo_box = get_child(gui, QComboBox, name="experiment_type")
-        combo_box.setCurrentIndex(3)
+    combo_box = get_child(gui, QComboBox, name="experiment_type")
+    combo_box.setCurrentIndex(3)
 
-        assert combo_box.currentText() == MultipleDataAssimilation.display_name()
+    assert combo_box.currentText() == MultipleDataAssimilation.display_name()
 
-        es_mda_panel = get_child(gui, QWidget, name="ES_MDA_panel")
-        assert es_mda_panel
+    es_mda_panel = get_child(gui, QWidget, name="ES_MDA_panel")
+    assert es_mda_panel
 
-        run_sim_button = get_child(gui, QToolButton, name="run_experiment")
-        assert run_sim_button
-        assert run_sim_button.isEnabled()
+    run_sim_button = get_child(gui, QToolButton, name="run_experiment")
+    assert run_sim_button
+    assert run_sim_button.isEnabled()
 
-        es_mda_panel._relative_iteration_weights_box.setText("0")
+    es_mda_panel._relative_iteration_weights_box.setText("0")
 
-        assert not run_sim_button.isEnabled()
+    assert not run_sim_button.isEnabled()
 
-        es_mda_panel._relative_iteration_weights_box.setText("1")
+    es_mda_panel._relative_iteration_weights_box.setText("1")
 
-        assert run_sim_button.isEnabled()
+    assert run_sim_button.isEnabled()
 
 
 @pytest.mark.usefixtures("copy_snake_oil_field")
-def test_that_ert_changes_to_config_directory(qtbot):
+def test_that_ert_changes_to_config_directory(qtbot, log_handler, start_gui):
     """
     This is a regression test that verifies that ert changes directories
     to the config dir (where .ert is).
     Failure to do so would in this case result in SURFACE keyword not
     finding the INIT_FILE provided (surface/small.irap)
     """
-    rng = np.random.default_rng()
-
     Path("./surface").mkdir()
-    nx = 5
-    ny = 10
-    surf = RegularSurface(
-        ncol=nx, nrow=ny, xinc=1.0, yinc=1.0, values=rng.standard_normal(size=(nx, ny))
+    # 5 x 10 irap ascii surface, only the header has to be valid for the config
+    Path("surface/surf_init_0.irap").write_text(
+        "-996 10 1.0 1.0\n0.0 4.0 0.0 9.0\n5 0.0 0.0 0.0\n0 0 0 0 0 0 0\n"
+        + "0.0 " * 50,
+        encoding="utf-8",
     )
-    surf.to_file("surface/surf_init_0.irap", fformat="irap_ascii")
 
-    args = Mock()
     os.chdir("..")
-    args.config = "test_data/snake_oil_surface.ert"
-    with add_gui_log_handler() as log_handler:
-        gui, *_ = ert.gui.main._start_initial_gui_window(args, log_handler)
-        assert gui.windowTitle().startswith("ERT - snake_oil_surface.ert")
+    args = gui_args("test_data/snake_oil_surface.ert")
+    gui, *_ = start_gui(args, log_handler)
+    assert gui.windowTitle().startswith("ERT - snake_oil_surface.ert")
 
 
 def test_that_the_plot_window_contains_the_expected_elements(
@@ -387,13 +406,18 @@ def click_tab_index(pos: int) -> None:
         click_plotter_item(gen_kw_index)
         assert plot_window._central_tab.currentIndex() == gen_kw_alternate_index
 
-        # finally click all items
+        # finally click all items, and render every tab once for the first
+        # item that enables it
+        rendered_tabs = set()
         for i in range(model.rowCount()):
             click_plotter_item(i)
             for tab_index in range(plot_window._central_tab.count()):
-                if not plot_window._central_tab.isTabEnabled(tab_index):
+                if tab_index in rendered_tabs or not (
+                    plot_window._central_tab.isTabEnabled(tab_index)
+                ):
                     continue
                 click_tab_index(tab_index)
+                rendered_tabs.add(tab_index)
 
         plot_window.close()
 
@@ -417,9 +441,7 @@ def test_that_the_manage_experiments_tool_can_be_used(esmda_has_run, qtbot):
     assert tree_view.model().rowCount() == 1
     assert tree_view.model().rowCount(tree_view.model().index(0, 0)) == 4
 
-    def handle_add_dialog():
-        dialog = wait_for_child(current_tab, qtbot, CreateExperimentDialog)
-
+    def handle_add_dialog(dialog):
         dialog._experiment_edit.setText("es_mda")
         assert not dialog._ok_button.isEnabled()
         dialog._experiment_edit.setText(" @not_v alid")
@@ -439,7 +461,7 @@ def handle_add_dialog():
 
         qtbot.mouseClick(dialog._ok_button, Qt.MouseButton.LeftButton)
 
-    QTimer.singleShot(1000, handle_add_dialog)
+    handle_when_shown(current_tab, CreateExperimentDialog, handle_add_dialog)
     create_widget = get_child(storage_widget, AddWidget)
     qtbot.mouseClick(create_widget.addButton, Qt.MouseButton.LeftButton)
 
@@ -469,8 +491,7 @@ def test_that_inversion_type_can_be_set_from_gui(qtbot, opened_main_window_poly)
 
     # Testing modal dialogs requires some care.
     # https://github.com/pytest-dev/pytest-qt/issues/256
-    def handle_analysis_module_panel():
-        var_panel = wait_for_child(gui, qtbot, AnalysisModuleVariablesPanel)
+    def handle_analysis_module_panel(var_panel):
         dropdown = wait_for_child(var_panel, qtbot, QComboBox)
         spinner = wait_for_child(var_panel, qtbot, QDoubleSpinBox, "enkf_truncation")
         assert [dropdown.itemText(i) for i in range(dropdown.count())] == [
@@ -484,7 +505,7 @@ def handle_analysis_module_panel():
 
         var_panel.parent().close()
 
-    QTimer.singleShot(500, handle_analysis_module_panel)
+    handle_when_shown(gui, AnalysisModuleVariablesPanel, handle_analysis_module_panel)
     qtbot.mouseClick(
         get_child(es_edit, QToolButton), Qt.MouseButton.LeftButton, delay=1
     )
@@ -542,7 +563,6 @@ def handle_add_dialog():
     qtbot.mouseClick(initialize_button, Qt.MouseButton.LeftButton)
 
 
-@pytest.mark.usefixtures("use_tmpdir")
 def test_that_load_results_manually_can_be_run_after_esmda(esmda_has_run, qtbot):
     load_results_manually(qtbot, esmda_has_run)
 
@@ -580,10 +600,6 @@ def test_that_a_failing_job_shows_error_message_with_context(
     run_experiment = get_child(experiment_panel, QWidget, name="run_experiment")
 
     def handle_error_dialog(run_dialog):
-        qtbot.waitUntil(
-            lambda: run_dialog.fail_msg_box is not None,
-            timeout=20000,
-        )
         error_dialog = run_dialog.fail_msg_box
         assert error_dialog
         text = error_dialog.details_text.toPlainText()
@@ -604,97 +620,94 @@ def handle_error_dialog(run_dialog):
     qtbot.mouseClick(run_experiment, Qt.MouseButton.LeftButton)
 
     run_dialog = wait_for_child(gui, qtbot, RunDialog)
-
-    QTimer.singleShot(200, lambda: handle_error_dialog(run_dialog))
-    qtbot.waitUntil(lambda: run_dialog.is_simulation_done() is True, timeout=100000)
+    wait_for_simulation_done(qtbot, run_dialog, timeout=100000)
+    handle_error_dialog(run_dialog)
 
 
-@pytest.mark.usefixtures("use_tmpdir", "set_site_config")
-def test_that_gui_plotter_works_when_no_data(qtbot, storage, monkeypatch):
-    monkeypatch.setattr(PlotApi, "get_all_ensembles", lambda _: [])
+@pytest.fixture
+def minimal_main_window(qtbot, storage, use_tmpdir, set_site_config):
+    """Main window for a config with a single realization and no data"""
     config_file = "minimal_config.ert"
     with open(config_file, "w", encoding="utf-8") as f:
         f.write("NUM_REALIZATIONS 1")
-    args_mock = Mock()
-    args_mock.config = config_file
+    args_mock = gui_args(config_file)
     ert_config = ErtConfig.from_file(config_file)
-    with StorageService.init_service(
-        project=os.path.abspath(ert_config.ens_path),
-    ):
-        gui = _setup_main_window(ert_config, args_mock, GUILogHandler(), storage)
-        qtbot.addWidget(gui)
-
-        button_plot_tool = gui.findChild(QToolButton, "button_Create_plot")
-        assert button_plot_tool
-        qtbot.mouseClick(button_plot_tool, Qt.MouseButton.LeftButton)
-        plot_window = wait_for_child(gui, qtbot, PlotWindow)
-
-        ensemble_plot_names = get_child(
-            plot_window, EnsembleSelectListWidget, "ensemble_selector"
-        ).get_checked_ensembles()
-        assert len(ensemble_plot_names) == 0
+    gui = _setup_main_window(ert_config, args_mock, GUILogHandler(), storage)
+    qtbot.addWidget(gui)
+    return gui
 
 
-@pytest.mark.usefixtures("use_tmpdir", "set_site_config")
-def test_right_click_plot_button_opens_external_plotter(qtbot, storage, monkeypatch):
+def test_that_gui_plotter_works_when_no_data(qtbot, minimal_main_window, monkeypatch):
+    # With both queries stubbed, the plotter never talks to the storage server
     monkeypatch.setattr(PlotApi, "get_all_ensembles", lambda _: [])
-    config_file = "minimal_config.ert"
-    with open(config_file, "w", encoding="utf-8") as f:
-        f.write("NUM_REALIZATIONS 1")
-    args_mock = Mock()
-    args_mock.config = config_file
-    ert_config = ErtConfig.from_file(config_file)
-    with StorageService.init_service(
-        project=os.path.abspath(ert_config.ens_path),
-    ):
-        gui = _setup_main_window(ert_config, args_mock, GUILogHandler(), storage)
-        qtbot.addWidget(gui)
+    monkeypatch.setattr(PlotApi, "all_data_type_keys", lambda _: [])
+    # Only the ensemble selector is inspected, the plot tabs are covered by
+    # test_right_click_plot_button_opens_external_plotter
+    monkeypatch.setattr(PlotWindow, "addPlotWidget", lambda *_, **__: None)
+    gui = minimal_main_window
 
-        button_plot_tool = gui.findChild(QToolButton, "button_Create_plot")
-        assert button_plot_tool
+    button_plot_tool = gui.findChild(QToolButton, "button_Create_plot")
+    assert button_plot_tool
+    qtbot.mouseClick(button_plot_tool, Qt.MouseButton.LeftButton)
+    plot_window = wait_for_child(gui, qtbot, PlotWindow)
 
-        def top_level_plotter_windows() -> list[PlotWindow]:
-            plot_windows = gui.get_external_plot_windows()
-            top_level_plot_windows = []
-
-            for win in plot_windows:
-                if "Plotting" in win.windowTitle() and win.isVisible():
-                    top_level_plot_windows.append(win)
-            return top_level_plot_windows
-
-        def right_click_plotter_button() -> None:
-            top_level_windows = len(top_level_plotter_windows())
-            qtbot.mouseClick(button_plot_tool, Qt.MouseButton.RightButton)
-            qtbot.wait_until(
-                lambda: len(top_level_plotter_windows()) > top_level_windows,
-                timeout=5000,
-            )
+    ensemble_plot_names = get_child(
+        plot_window, EnsembleSelectListWidget, "ensemble_selector"
+    ).get_checked_ensembles()
+    assert len(ensemble_plot_names) == 0
 
-        right_click_plotter_button()
-        right_click_plotter_button()
-        right_click_plotter_button()
 
-        window_list = top_level_plotter_windows()
-        assert len(window_list) == 3
+def test_right_click_plot_button_opens_external_plotter(
+    qtbot, minimal_main_window, monkeypatch
+):
+    monkeypatch.setattr(PlotApi, "get_all_ensembles", lambda _: [])
+    monkeypatch.setattr(PlotApi, "all_data_type_keys", lambda _: [])
+    gui = minimal_main_window
+
+    button_plot_tool = gui.findChild(QToolButton, "button_Create_plot")
+    assert button_plot_tool
+
+    def top_level_plotter_windows() -> list[PlotWindow]:
+        plot_windows = gui.get_external_plot_windows()
+        top_level_plot_windows = []
+
+        for win in plot_windows:
+            if "Plotting" in win.windowTitle() and win.isVisible():
+                top_level_plot_windows.append(win)
+        return top_level_plot_windows
+
+    def right_click_plotter_button() -> None:
+        top_level_windows = len(top_level_plotter_windows())
+        qtbot.mouseClick(button_plot_tool, Qt.MouseButton.RightButton)
+        qtbot.wait_until(
+            lambda: len(top_level_plotter_windows()) > top_level_windows,
+            timeout=5000,
+        )
+
+    right_click_plotter_button()
+    right_click_plotter_button()
+    right_click_plotter_button()
 
-        for window in window_list:
-            window.close()
+    window_list = top_level_plotter_windows()
+    assert len(window_list) == 3
 
-        qtbot.wait_until(lambda: not top_level_plotter_windows(), timeout=5000)
+    for window in window_list:
+        window.close()
 
-        qtbot.mouseClick(button_plot_tool, Qt.MouseButton.LeftButton)
-        plot_window = wait_for_child(gui, qtbot, PlotWindow)
-        assert plot_window
-        assert "Plotting" in plot_window.windowTitle()
+    qtbot.wait_until(lambda: not top_level_plotter_windows(), timeout=5000)
 
-    gui.close()
+    qtbot.mouseClick(button_plot_tool, Qt.MouseButton.LeftButton)
+    plot_window = wait_for_child(gui, qtbot, PlotWindow)
+    assert plot_window
+    assert "Plotting" in plot_window.windowTitle()
 
 
 @pytest.mark.usefixtures("copy_poly_case")
-def test_that_es_mda_restart_run_box_is_disabled_when_there_are_no_cases(qtbot):
-    args = Mock()
-    args.config = "poly.ert"
-    gui, *_ = ert.gui.main._start_initial_gui_window(args, GUILogHandler())
+def test_that_es_mda_restart_run_box_is_disabled_when_there_are_no_cases(
+    qtbot, start_gui
+):
+    args = gui_args("poly.ert")
+    gui, *_ = start_gui(args, GUILogHandler())
     assert gui.windowTitle().startswith("ERT - poly.ert")
 
     combo_box = get_child(gui, QComboBox, name="experiment_type")
@@ -722,10 +735,9 @@ def test_that_es_mda_restart_run_box_is_disabled_when_there_are_no_cases(qtbot):
 
 
 @pytest.mark.usefixtures("copy_poly_case")
-def test_help_menu(qtbot):
-    args = Mock()
-    args.config = "poly.ert"
-    gui, *_ = ert.gui.main._start_initial_gui_window(args, GUILogHandler())
+def test_help_menu(qtbot, start_gui):
+    args = gui_args("poly.ert")
+    gui, *_ = start_gui(args, GUILogHandler())
     assert gui.windowTitle().startswith("ERT - poly.ert")
     menu_bar = gui.menuBar()
     assert isinstance(menu_bar, QMenuBar)
@@ -775,20 +787,22 @@ def test_that_simulation_status_button_adds_menu_on_subsequent_runs(
     opened_main_window_poly, qtbot
 ):
     gui = opened_main_window_poly
+    # The sidebar buttons live as long as the window, so look them up once
+    sidebar_buttons = {
+        name: get_child(gui, SidebarToolButton, name)
+        for name in ("button_Simulation_status", "button_Start_simulation")
+    }
 
     def find_and_click_button(
         button_name: str, should_click: bool, expected_enabled_state: bool
     ):
-        button = gui.findChild(SidebarToolButton, button_name)
-        assert button
+        button = sidebar_buttons[button_name]
         assert button.isEnabled() == expected_enabled_state
         if should_click:
             qtbot.mouseClick(button, Qt.MouseButton.LeftButton)
 
     def find_and_check_selected(button_name: str, expected_selected_state: bool):
-        button = gui.findChild(SidebarToolButton, button_name)
-        assert button
-        assert button.isChecked() == expected_selected_state
+        assert sidebar_buttons[button_name].isChecked() == expected_selected_state
 
     def run_experiment():
         run_experiment_panel = wait_for_child(gui, qtbot, ExperimentPanel)
@@ -800,7 +814,7 @@ def wait_for_simulation_completed():
         run_dialogs = get_children(gui, RunDialog)
         dialog = run_dialogs[-1]
         qtbot.wait_until(lambda: not dialog.isHidden(), timeout=5000)
-        qtbot.wait_until(lambda: dialog.is_simulation_done() is True, timeout=15000)
+        wait_for_simulation_done(qtbot, dialog, timeout=15000)
 
     # not clickable since no simulations started yet
     find_and_click_button("button_Simulation_status", False, False)
@@ -819,9 +833,7 @@ def wait_for_simulation_completed():
     qtbot.wait_until(lambda: not run_dialog.isHidden(), timeout=5000)
 
     # verify no drop menu
-    button_simulation_status = gui.findChild(
-        SidebarToolButton, "button_Simulation_status"
-    )
+    button_simulation_status = sidebar_buttons["button_Simulation_status"]
     assert button_simulation_status.menu() is None
 
     find_and_click_button("button_Start_simulation", True, True)
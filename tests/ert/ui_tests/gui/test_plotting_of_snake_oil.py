@@ -22,7 +22,7 @@
 from ert.services import StorageService
 from ert.storage import open_storage
 
-from .conftest import get_child, wait_for_child
+from .conftest import get_child, gui_args, wait_for_child
 
 
 # Use a fixture for the figure in order for the lifetime
@@ -129,8 +129,7 @@ def test_that_all_snake_oil_visualisations_matches_snapshot(plot_figure):
 def test_that_all_plotter_filter_boxes_yield_expected_filter_results(
     qtbot, snake_oil_case_storage
 ):
-    args_mock = Mock()
-    args_mock.config = "snake_oil.ert"
+    args_mock = gui_args("snake_oil.ert")
 
     log_handler = GUILogHandler()
     with (
@@ -10,7 +10,7 @@
 from ert.gui.simulation.run_dialog import RunDialog
 from ert.gui.simulation.view import RealizationWidget
 
-from .conftest import wait_for_child
+from .conftest import wait_for_child, wait_for_simulation_done
 
 
 def test_restart_failed_realizations(opened_main_window_poly, qtbot):
@@ -73,7 +73,7 @@ def _evaluate(coeffs, x):
 
     # The Run dialog opens, wait until restart appears and the tab is ready
     run_dialog = wait_for_child(gui, qtbot, RunDialog)
-    qtbot.waitUntil(lambda: run_dialog.is_simulation_done() is True, timeout=60000)
+    wait_for_simulation_done(qtbot, run_dialog, timeout=60000)
     qtbot.waitUntil(lambda: run_dialog._tab_widget.currentWidget() is not None)
 
     # Assert that the number of boxes in the detailed view is
@@ -106,7 +106,7 @@ def handle_dialog():
     QTimer.singleShot(500, handle_dialog)
     qtbot.mouseClick(run_dialog.restart_button, Qt.MouseButton.LeftButton)
 
-    qtbot.waitUntil(lambda: run_dialog.is_simulation_done() is True, timeout=60000)
+    wait_for_simulation_done(qtbot, run_dialog, timeout=60000)
     qtbot.waitUntil(lambda: run_dialog._tab_widget.currentWidget() is not None)
 
     # We expect to have the same amount of realizations in list_model
@@ -135,7 +135,7 @@ def handle_dialog():
     write_poly_eval(failing_reals=failing_reals_third_try)
     qtbot.mouseClick(run_dialog.restart_button, Qt.MouseButton.LeftButton)
 
-    qtbot.waitUntil(lambda: run_dialog.is_simulation_done() is True, timeout=60000)
+    wait_for_simulation_done(qtbot, run_dialog, timeout=60000)
     qtbot.waitUntil(lambda: run_dialog._tab_widget.currentWidget() is not None)
 
     # We expect to have the same amount of realizations in list_model
@@ -3,7 +3,6 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 from textwrap import dedent
-from unittest.mock import Mock
 
 import pytest
 from PyQt6.QtCore import Qt
@@ -20,7 +19,7 @@
 from ert.storage import Storage, open_storage
 from ert.validation import rangestring_to_mask
 
-from .conftest import get_child
+from .conftest import get_child, gui_args
 
 
 @contextmanager
@@ -63,8 +62,7 @@ def _open_main_window(
 
     config = ErtConfig.from_file(path / "config.ert")
 
-    args_mock = Mock()
-    args_mock.config = "config.ert"
+    args_mock = gui_args("config.ert")
     # handler defined here to ensure lifetime until end of function, if inlined
     # it will cause the following error:
     # RuntimeError: wrapped C/C++ object of type GUILogHandler
@@ -1,6 +1,5 @@
 from pathlib import Path
 from textwrap import dedent
-from unittest.mock import Mock
 
 import pytest
 from PyQt6.QtCore import Qt, QTimer
@@ -15,6 +14,7 @@
 from .conftest import (
     add_experiment_manually,
     get_child,
+    gui_args,
     load_results_manually,
     wait_for_child,
 )
@@ -72,8 +72,7 @@ def gen_data_in_runpath(tmp_path):
 def test_rft_csv_export_plugin_exports_rft_data(
     qtbot, ert_rft_setup, well_file, gen_data_in_runpath
 ):
-    args = Mock()
-    args.config = "config.ert"
+    args = gui_args("config.ert")
 
     output_file = Path("output.csv")
     with ErtPluginContext():
@@ -2,7 +2,6 @@
 from collections.abc import Generator
 from contextlib import contextmanager
 from textwrap import dedent
-from unittest.mock import Mock
 
 import pytest
 from PyQt6.QtCore import Qt, QTimer
@@ -17,7 +16,7 @@
 from ert.run_models import EnsembleExperiment
 from ert.storage import Storage, open_storage
 
-from .conftest import get_child, wait_for_child
+from .conftest import get_child, gui_args, wait_for_child
 
 
 @contextmanager
@@ -37,8 +36,7 @@ def _open_main_window(
             ctx.plugin_manager.forward_model_steps
         ).from_file(path / "config.ert")
 
-        args_mock = Mock()
-        args_mock.config = "config.ert"
+        args_mock = gui_args("config.ert")
         # handler defined here to ensure lifetime until end of function, if inlined
         # it will cause the following error:
         # RuntimeError: wrapped C/C++ object of type GUILogHandler
@@ -109,25 +109,36 @@ def patch_base_run_model(monkeypatch):
         BaseRunModel, "validate_successful_realizations_count", MagicMock()
     )
     monkeypatch.setattr(BaseRunModel, "set_env_key", MagicMock())
+    monkeypatch.setattr(base_run_model, "smoother_update", MagicMock())
+    monkeypatch.setattr(base_run_model, "_seed_sequence", MagicMock(return_value=0))
 
 
-@pytest.mark.usefixtures("patch_base_run_model")
-def test_hook_call_order_ensemble_smoother(monkeypatch):
-    """
-    The goal of this test is to assert that the hook call order is the same
-    across different models.
-    """
+@pytest.fixture
+def run_workflows_mock(monkeypatch):
     run_wfs_mock = MagicMock()
-    monkeypatch.setattr(ensemble_smoother, "sample_prior", MagicMock())
-    monkeypatch.setattr(base_run_model, "smoother_update", MagicMock())
-    monkeypatch.setattr(base_run_model, "_seed_sequence", MagicMock(return_value=0))
-    monkeypatch.setattr(base_run_model.BaseRunModel, "run_workflows", run_wfs_mock)
+    monkeypatch.setattr(BaseRunModel, "run_workflows", run_wfs_mock)
+    return run_wfs_mock
+
 
+@pytest.fixture
+def storage_mock():
     ens_mock = MagicMock()
     ens_mock.iteration = 0
     ens_mock.id = uuid.uuid1()
     storage_mock = MagicMock()
     storage_mock.create_ensemble.return_value = ens_mock
+    return storage_mock
+
+
+@pytest.mark.usefixtures("patch_base_run_model")
+def test_hook_call_order_ensemble_smoother(
+    monkeypatch, run_workflows_mock, storage_mock
+):
+    """
+    The goal of this test is to assert that the hook call order is the same
+    across different models.
+    """
+    monkeypatch.setattr(ensemble_smoother, "sample_prior", MagicMock())
 
     test_class = EnsembleSmoother(
         *[MagicMock()] * 11,
@@ -137,32 +148,20 @@ def test_hook_call_order_ensemble_smoother(monkeypatch):
     test_class._design_matrix = None
     test_class.run_experiment(MagicMock())
 
-    assert run_wfs_mock.mock_calls == EXPECTED_CALL_ORDER
+    assert run_workflows_mock.mock_calls == EXPECTED_CALL_ORDER
 
 
 @pytest.mark.usefixtures("patch_base_run_model")
-def test_hook_call_order_es_mda(monkeypatch):
+def test_hook_call_order_es_mda(monkeypatch, run_workflows_mock, storage_mock):
     """
     The goal of this test is to assert that the hook call order is the same
     across different models.
     """
-
-    run_wfs_mock = MagicMock()
     monkeypatch.setattr(multiple_data_assimilation, "sample_prior", MagicMock())
     monkeypatch.setattr(
-        multiple_data_assimilation.MultipleDataAssimilation,
-        "parse_weights",
-        MagicMock(return_value=[1]),
+        MultipleDataAssimilation, "parse_weights", MagicMock(return_value=[1])
     )
-    monkeypatch.setattr(base_run_model, "smoother_update", MagicMock())
-    monkeypatch.setattr(base_run_model, "_seed_sequence", MagicMock(return_value=0))
-    monkeypatch.setattr(base_run_model.BaseRunModel, "run_workflows", run_wfs_mock)
 
-    ens_mock = MagicMock()
-    ens_mock.iteration = 0
-    ens_mock.id = uuid.uuid1()
-    storage_mock = MagicMock()
-    storage_mock.create_ensemble.return_value = ens_mock
     test_class = MultipleDataAssimilation(
         *[MagicMock()] * 14,
     )
@@ -172,4 +171,4 @@ def test_hook_call_order_es_mda(monkeypatch):
     test_class._design_matrix = None
     test_class.run_experiment(MagicMock())
 
-    assert run_wfs_mock.mock_calls == EXPECTED_CALL_ORDER
+    assert run_workflows_mock.mock_calls == EXPECTED_CALL_ORDER
@@ -1,8 +1,7 @@
-import copy
 import logging
 import os
 import os.path
-import stat
+from pathlib import Path
 from textwrap import dedent
 
 import pytest
@@ -144,19 +143,15 @@ def _generate_step(
         str_none_sensitive(max_running_minutes),
     ]
 
-    config_contents = ""
+    lines = []
     for key, val in zip(forward_model_keywords, values, strict=False):
         if key == "ENV" and val:
-            for k, v in val.items():
-                config_contents += f"{key} {k} {v}\n"
+            lines.extend(f"{key} {k} {v}" for k, v in val.items())
         elif val is not None:
-            config_contents += f"{key} {val}\n"
+            lines.append(f"{key} {val}")
+    config_contents = "".join(f"{line}\n" for line in lines)
 
-    with open(executable, "w", encoding="utf-8"):
-        pass
-    mode = os.stat(executable).st_mode
-    mode |= stat.S_IXUSR | stat.S_IXGRP
-    os.chmod(executable, stat.S_IMODE(mode))
+    Path(executable).touch(mode=0o755)
 
     return _forward_model_step_from_config_contents(config_contents, config_file, name)
 
@@ -213,10 +208,10 @@ def validate_forward_model(forward_model, forward_model_config):
 
 
 def generate_step_from_dict(forward_model_config):
-    forward_model_config = copy.deepcopy(forward_model_config)
-    forward_model_config["executable"] = os.path.join(
-        os.getcwd(), forward_model_config["executable"]
-    )
+    forward_model_config = {
+        **forward_model_config,
+        "executable": os.path.join(os.getcwd(), forward_model_config["executable"]),
+    }
     forward_model = _generate_step(
         forward_model_config["name"],
         forward_model_config["executable"],
@@ -239,12 +234,34 @@ def set_up_forward_model(fm_steplist) -> list[ForwardModelStep]:
     return [generate_step_from_dict(step) for step in fm_steplist]
 
 
-def verify_json_dump(fm_steplist, config, selected_steps, run_id):
-    expected_default_env = {
-        "_ERT_ITERATION_NUMBER": "0",
-        "_ERT_REALIZATION_NUMBER": "0",
-        "_ERT_RUNPATH": "./",
+EXPECTED_DEFAULT_ENV = {
+    "_ERT_ITERATION_NUMBER": "0",
+    "_ERT_REALIZATION_NUMBER": "0",
+    "_ERT_RUNPATH": "./",
+}
+
+
+def expected_json_step(step, step_index):
+    """The jobList entry expected for step, except for the executable"""
+    if step["environment"] is None:
+        environment = EXPECTED_DEFAULT_ENV
+    else:
+        environment = {
+            k: EXPECTED_DEFAULT_ENV[k] if k in ForwardModelStep.default_env else v
+            for k, v in step["environment"].items()
+        }
+    return {key: step[key] for key in json_keywords if key != "executable"} | {
+        # Since no argList is loaded as an empty list by forward_model
+        "argList": empty_list_if_none(step["argList"]),
+        # Since name is set to default if none provided by forward_model
+        "name": default_name_if_none(step["name"]),
+        "stdout": create_std_file(step, std="stdout", step_index=step_index),
+        "stderr": create_std_file(step, std="stderr", step_index=step_index),
+        "environment": environment,
     }
+
+
+def verify_json_dump(fm_steplist, config, selected_steps, run_id):
     assert "config_path" in config
     assert "config_file" in config
     assert run_id == config["run_id"]
@@ -252,38 +269,10 @@ def verify_json_dump(fm_steplist, config, selected_steps, run_id):
 
     for step_index, selected_step in enumerate(selected_steps):
         step = fm_steplist[selected_step]
-        loaded_step = config["jobList"][step_index]
+        loaded_step = dict(config["jobList"][step_index])
 
-        # Since no argList is loaded as an empty list by forward_model
-        arg_list_back_up = step["argList"]
-        step["argList"] = empty_list_if_none(step["argList"])
-
-        # Since name is set to default if none provided by forward_model
-        name_back_up = step["name"]
-        step["name"] = default_name_if_none(step["name"])
-
-        for key in json_keywords:
-            if key in {"stdout", "stderr"}:
-                assert (
-                    create_std_file(step, std=key, step_index=step_index)
-                    == loaded_step[key]
-                )
-            elif key == "executable":
-                assert step[key] in loaded_step[key]
-            elif key == "environment" and step[key] is None:
-                assert loaded_step[key] == expected_default_env
-            elif key == "environment" and step[key] is not None:
-                for k in step[key]:
-                    if k not in ForwardModelStep.default_env:
-                        assert step[key][k] == loaded_step[key][k]
-                    else:
-                        assert step[key][k] == ForwardModelStep.default_env[k]
-                        assert loaded_step[key][k] == expected_default_env[k]
-            else:
-                assert step[key] == loaded_step[key]
-
-        step["argList"] = arg_list_back_up
-        step["name"] = name_back_up
+        assert step["executable"] in loaded_step.pop("executable")
+        assert loaded_step == expected_json_step(step, step_index)
 
 
 @pytest.mark.usefixtures("use_tmpdir")
@@ -291,7 +280,7 @@ def test_config_path_and_file(context):
     run_id = "test_config_path_and_file_in_jobs_json"
 
     ert_config = ErtConfig(
-        forward_model_steps=set_up_forward_model([]),
+        forward_model_steps=[],
         substitutions=context,
         user_config_file="path_to_config_file/config.ert",
     )
@@ -313,7 +302,7 @@ def test_no_steps(context):
     run_id = "test_no_jobs_id"
 
     ert_config = ErtConfig(
-        forward_model_steps=set_up_forward_model([]),
+        forward_model_steps=[],
         substitutions=context,
         user_config_file="path_to_config_file/config.ert",
     )
@@ -330,24 +319,25 @@ def test_no_steps(context):
 
 
 @pytest.mark.usefixtures("use_tmpdir")
-def test_one_step(fm_step_list, context):
-    for i, step in enumerate(fm_step_list):
-        run_id = "test_one_job"
+@pytest.mark.parametrize("step_name", ["PERLIN", "AGGREGATOR", "PI", "OPTIMUS"])
+def test_one_step(fm_step_list, context, step_name):
+    step_index = [step["name"] for step in fm_step_list].index(step_name)
+    run_id = "test_one_job"
 
-        ert_config = ErtConfig(
-            forward_model_steps=set_up_forward_model([step]),
-            substitutions=context,
-        )
+    ert_config = ErtConfig(
+        forward_model_steps=set_up_forward_model([fm_step_list[step_index]]),
+        substitutions=context,
+    )
 
-        data = create_forward_model_json(
-            context=ert_config.substitutions,
-            forward_model_steps=ert_config.forward_model_steps,
-            env_vars=ert_config.env_vars,
-            user_config_file=ert_config.user_config_file,
-            run_id=run_id,
-        )
+    data = create_forward_model_json(
+        context=ert_config.substitutions,
+        forward_model_steps=ert_config.forward_model_steps,
+        env_vars=ert_config.env_vars,
+        user_config_file=ert_config.user_config_file,
+        run_id=run_id,
+    )
 
-        verify_json_dump(fm_step_list, data, [i], run_id)
+    verify_json_dump(fm_step_list, data, [step_index], run_id)
 
 
 def run_all(fm_steplist, context):
@@ -412,6 +402,15 @@ def test_that_values_with_brackets_are_ommitted(caplog, fm_step_list, context):
     assert "ENV_VAR" not in data["jobList"][0]["environment"]
 
 
+JOB_WITH_DEFAULT_ARGUMENT = dedent(
+    """
+    EXECUTABLE echo
+    DEFAULT <ARGUMENTA> DEFAULT_ARGA_VALUE
+    ARGLIST <ARGUMENTA> <ARGUMENTB> <ARGUMENTC>
+    """
+)
+
+
 @pytest.mark.usefixtures("use_tmpdir")
 @pytest.mark.parametrize(
     "job, forward_model, expected_args",
@@ -455,13 +454,7 @@ def test_that_values_with_brackets_are_ommitted(caplog, fm_step_list, context):
             id="With argument",
         ),
         pytest.param(
-            dedent(
-                """
-            EXECUTABLE echo
-            DEFAULT <ARGUMENTA> DEFAULT_ARGA_VALUE
-            ARGLIST <ARGUMENTA> <ARGUMENTB> <ARGUMENTC>
-                """
-            ),
+            JOB_WITH_DEFAULT_ARGUMENT,
             "DEFINE <TO_BE_DEFINED> <ARGUMENTB>\n"
             "FORWARD_MODEL job_name(<ARGUMENTA>=configured_argumentA,"
             " <TO_BE_DEFINED>=configured_argumentB)",
@@ -474,13 +467,7 @@ def test_that_values_with_brackets_are_ommitted(caplog, fm_step_list, context):
             "so argument B gets no value",
         ),
         pytest.param(
-            dedent(
-                """
-            EXECUTABLE echo
-            DEFAULT <ARGUMENTA> DEFAULT_ARGA_VALUE
-            ARGLIST <ARGUMENTA> <ARGUMENTB> <ARGUMENTC>
-                """
-            ),
+            JOB_WITH_DEFAULT_ARGUMENT,
             dedent(
                 """
             DEFINE <ARGUMENTB> DEFINED_ARGUMENTB_VALUE
@@ -491,25 +478,13 @@ def test_that_values_with_brackets_are_ommitted(caplog, fm_step_list, context):
             id="Resolved argument given by argument list, not overridden by global",
         ),
         pytest.param(
-            dedent(
-                """
-            EXECUTABLE echo
-            DEFAULT <ARGUMENTA> DEFAULT_ARGA_VALUE
-            ARGLIST <ARGUMENTA> <ARGUMENTB> <ARGUMENTC>
-            """
-            ),
+            JOB_WITH_DEFAULT_ARGUMENT,
             "FORWARD_MODEL job_name()",
             ["DEFAULT_ARGA_VALUE", "<ARGUMENTB>", "<ARGUMENTC>"],
             id="No args, parenthesis, gives default argument A",
         ),
         pytest.param(
-            dedent(
-                """
-            EXECUTABLE echo
-            DEFAULT <ARGUMENTA> DEFAULT_ARGA_VALUE
-            ARGLIST <ARGUMENTA> <ARGUMENTB> <ARGUMENTC>
-            """
-            ),
+            JOB_WITH_DEFAULT_ARGUMENT,
             "FORWARD_MODEL job_name",
             ["DEFAULT_ARGA_VALUE", "<ARGUMENTB>", "<ARGUMENTC>"],
             id="No args, gives default argument A",
@@ -539,22 +514,11 @@ def test_that_values_with_brackets_are_ommitted(caplog, fm_step_list, context):
     ],
 )
 def test_forward_model_job(job, forward_model, expected_args):
-    with open("job_file", "w", encoding="utf-8") as fout:
-        fout.write(job)
-
-    with open("config_file.ert", "w", encoding="utf-8") as fout:
-        # Write a minimal config file
-        fout.write(
-            dedent(
-                """
-        NUM_REALIZATIONS 1
-        """
-            )
-        )
-        fout.write("INSTALL_JOB job_name job_file\n")
-        fout.write(forward_model)
+    Path("job_file").write_text(job, encoding="utf-8")
 
-    ert_config = ErtConfig.from_file("config_file.ert")
+    ert_config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\nINSTALL_JOB job_name job_file\n" + forward_model
+    )
 
     forward_model = ert_config.forward_model_steps
 
@@ -582,13 +546,11 @@ def test_that_config_path_is_the_directory_of_the_main_ert_config():
             )
         )
 
-    with open("config_file.ert", "w", encoding="utf-8") as fout:
-        # Write a minimal config file
-        fout.write("NUM_REALIZATIONS 1\n")
-        fout.write("INSTALL_JOB job_name jobdir/job_file\n")
-        fout.write("FORWARD_MODEL job_name")
-
-    ert_config = ErtConfig.from_file("config_file.ert")
+    ert_config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\n"
+        "INSTALL_JOB job_name jobdir/job_file\n"
+        "FORWARD_MODEL job_name"
+    )
     data = create_forward_model_json(
         context=ert_config.substitutions,
         forward_model_steps=ert_config.forward_model_steps,
@@ -613,14 +575,12 @@ def test_that_private_over_global_args_gives_logging_message(caplog):
             )
         )
 
-    with open("config_file.ert", "w", encoding="utf-8") as fout:
-        # Write a minimal config file
-        fout.write("NUM_REALIZATIONS 1\n")
-        fout.write("DEFINE <ARG> A\n")
-        fout.write("INSTALL_JOB job_name job_file\n")
-        fout.write("FORWARD_MODEL job_name(<ARG>=B)")
-
-    ert_config = ErtConfig.from_file("config_file.ert")
+    ert_config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\n"
+        "DEFINE <ARG> A\n"
+        "INSTALL_JOB job_name job_file\n"
+        "FORWARD_MODEL job_name(<ARG>=B)"
+    )
     data = create_forward_model_json(
         context=ert_config.substitutions,
         forward_model_steps=ert_config.forward_model_steps,
@@ -652,14 +612,12 @@ def test_that_private_over_global_args_does_not_give_logging_message_for_argpass
             )
         )
 
-    with open("config_file.ert", "w", encoding="utf-8") as fout:
-        # Write a minimal config file
-        fout.write("NUM_REALIZATIONS 1\n")
-        fout.write("DEFINE <ARG> A\n")
-        fout.write("INSTALL_JOB job_name job_file\n")
-        fout.write("FORWARD_MODEL job_name(<ARG>=<ARG>)")
-
-    ert_config = ErtConfig.from_file("config_file.ert")
+    ert_config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\n"
+        "DEFINE <ARG> A\n"
+        "INSTALL_JOB job_name job_file\n"
+        "FORWARD_MODEL job_name(<ARG>=<ARG>)"
+    )
     data = create_forward_model_json(
         context=ert_config.substitutions,
         forward_model_steps=ert_config.forward_model_steps,
@@ -695,22 +653,11 @@ def test_that_environment_variables_are_set_in_forward_model(
     monkeypatch, job, forward_model, expected_args
 ):
     monkeypatch.setenv("ENV", "env_value")
-    with open("job_file", "w", encoding="utf-8") as fout:
-        fout.write(job)
+    Path("job_file").write_text(job, encoding="utf-8")
 
-    with open("config_file.ert", "w", encoding="utf-8") as fout:
-        # Write a minimal config file
-        fout.write(
-            dedent(
-                """
-        NUM_REALIZATIONS 1
-        """
-            )
-        )
-        fout.write("INSTALL_JOB job_name job_file\n")
-        fout.write(forward_model)
-
-    ert_config = ErtConfig.from_file("config_file.ert")
+    ert_config = ErtConfig.from_file_contents(
+        "NUM_REALIZATIONS 1\nINSTALL_JOB job_name job_file\n" + forward_model
+    )
     data = create_forward_model_json(
         context=ert_config.substitutions,
         forward_model_steps=ert_config.forward_model_steps,
@@ -65,7 +65,14 @@ def test_memory_usage_counts_grandchildren():
                 parent = os.fork()
                 if not parent:
                     os.execv(sys.argv[-3], [sys.argv[-3], str(counter - 1), str(blobsize)])
-            time.sleep(3)"""  # Too low sleep will make the test faster but flaky
+            else:
+                open("allocated", "w").close()
+
+            # Keep the whole process tree alive until the innermost process
+            # has allocated, then give the memory poller time to observe it
+            while not os.path.exists("allocated"):
+                time.sleep(0.01)
+            time.sleep(0.5)"""
             )
         )
     executable = os.path.realpath(scriptname)
@@ -80,6 +87,7 @@ def max_memory_per_subprocess_layer(layers: int) -> int:
             0,
         )
         fmstep.MEMORY_POLL_PERIOD = 0.01
+        pathlib.Path("allocated").unlink(missing_ok=True)
         max_seen = 0
         for status in fmstep.run():
             if isinstance(status, Running):
@@ -229,25 +237,17 @@ def test_run_with_defined_executable_no_exec_bit():
     assert "foo is not an executable" in start_message.error_message
 
 
-def test_init_fmstep_no_std():
-    fmstep = ForwardModelStep(
-        {},
-        0,
-    )
-    assert fmstep.std_err is None
-    assert fmstep.std_out is None
-
-
-def test_init_fmstep_with_std():
-    fmstep = ForwardModelStep(
-        {
-            "stdout": "exit_out",
-            "stderr": "exit_err",
-        },
-        0,
-    )
-    assert fmstep.std_err == "exit_err"
-    assert fmstep.std_out == "exit_out"
+@pytest.mark.parametrize(
+    "step_data, expected_out, expected_err",
+    [
+        ({}, None, None),
+        ({"stdout": "exit_out", "stderr": "exit_err"}, "exit_out", "exit_err"),
+    ],
+)
+def test_init_fmstep_std(step_data, expected_out, expected_err):
+    fmstep = ForwardModelStep(step_data, 0)
+    assert fmstep.std_out == expected_out
+    assert fmstep.std_err == expected_err
 
 
 def test_makedirs(monkeypatch, tmp_path):
@@ -7,6 +7,14 @@
 logger = logging.getLogger(__name__)
 
 
+@pytest.fixture
+def logging_handle():
+    handle = GUILogHandler()
+    logger.addHandler(handle)
+    yield handle
+    logger.removeHandler(handle)
+
+
 @pytest.mark.parametrize(
     "log_func, expected",
     [
@@ -16,10 +24,7 @@
         (logger.error, "ERROR    Writing some text"),
     ],
 )
-def test_logging_widget(qtbot, caplog, log_func, expected):
-    logging_handle = GUILogHandler()
-    logger.addHandler(logging_handle)
-
+def test_logging_widget(qtbot, caplog, logging_handle, log_func, expected):
     widget = EventViewerPanel(logging_handle)
     widget.show()
     qtbot.addWidget(widget)
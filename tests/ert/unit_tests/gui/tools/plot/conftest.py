@@ -1,6 +1,4 @@
 import io
-import os
-import shutil
 from contextlib import contextmanager
 from unittest.mock import MagicMock
 
@@ -30,20 +28,16 @@ def is_success(self):
 
 
 @pytest.fixture
-def api(tmpdir, source_root, monkeypatch):
+def api(source_root, monkeypatch):
     @contextmanager
     def session(project: str):
         yield MagicMock(get=mocked_requests_get)
 
     monkeypatch.setattr(StorageService, "session", session)
 
-    with tmpdir.as_cwd():
-        test_data_root = source_root / "test-data" / "ert"
-        test_data_dir = os.path.join(test_data_root, "snake_oil")
-        shutil.copytree(test_data_dir, "test_data")
-        os.chdir("test_data")
-        api = PlotApi(test_data_dir)
-        yield api
+    # All requests are answered by mocked_requests_get, so the storage
+    # in the test data is never read and does not need to be copied
+    return PlotApi(source_root / "test-data" / "ert" / "snake_oil")
 
 
 def mocked_requests_get(*args, **kwargs):
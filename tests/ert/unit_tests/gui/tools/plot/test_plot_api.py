@@ -36,8 +36,8 @@ def test_escape(s: str) -> str:
 
 
 def test_key_def_structure(api):
-    key_defs = api.all_data_type_keys()
-    fopr = next(x for x in key_defs if x.key == "FOPR")
+    key_defs = {key_def.key: key_def for key_def in api.all_data_type_keys()}
+    fopr = key_defs["FOPR"]
     fopr_expected = {
         "dimensionality": 2,
         "index_type": "VALUE",
@@ -48,7 +48,7 @@ def test_key_def_structure(api):
     }
     assert fopr == PlotApiKeyDefinition(**fopr_expected)
 
-    bpr = next(x for x in key_defs if x.key == "BPR:1,3,8")
+    bpr = key_defs["BPR:1,3,8"]
     bpr_expected = {
         "dimensionality": 2,
         "index_type": "VALUE",
@@ -59,9 +59,7 @@ def test_key_def_structure(api):
     }
     assert bpr == PlotApiKeyDefinition(**bpr_expected)
 
-    bpr_parameter = next(
-        x for x in key_defs if x.key == "SNAKE_OIL_PARAM:BPR_138_PERSISTENCE"
-    )
+    bpr_parameter = key_defs["SNAKE_OIL_PARAM:BPR_138_PERSISTENCE"]
     bpr_parameter_expected = {
         "dimensionality": 1,
         "index_type": None,
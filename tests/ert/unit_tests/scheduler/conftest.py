@@ -12,12 +12,23 @@
 from ert.scheduler.local_driver import LocalDriver
 
 
+def _accept_iens(func):
+    """Wrap a mock callback so that it can always be called with iens"""
+    if func is None or func.__code__.co_argcount > 0:
+        return func
+
+    async def call_without_iens(iens):
+        return await func()
+
+    return call_without_iens
+
+
 class MockDriver(LocalDriver):
     def __init__(self, init=None, wait=None, kill=None):
         super().__init__()
         self._mock_init = init
-        self._mock_wait = wait
-        self._mock_kill = kill
+        self._mock_wait = _accept_iens(wait)
+        self._mock_kill = _accept_iens(kill)
 
     async def _init(self, iens, *args, **kwargs):
         if self._mock_init is not None:
@@ -26,11 +37,7 @@ async def _init(self, iens, *args, **kwargs):
 
     async def _wait(self, iens):
         if self._mock_wait is not None:
-            if self._mock_wait.__code__.co_argcount > 0:
-                result = await self._mock_wait(iens)
-            else:
-                result = await self._mock_wait()
-
+            result = await self._mock_wait(iens)
             if result is None:
                 return 0
             elif isinstance(result, bool):
@@ -45,10 +52,7 @@ async def _wait(self, iens):
 
     async def _kill(self, iens):
         if self._mock_kill is not None:
-            if self._mock_kill.__code__.co_argcount > 0:
-                await self._mock_kill(iens)
-            else:
-                await self._mock_kill()
+            await self._mock_kill(iens)
         return 1
 
 
@@ -1,5 +1,6 @@
 import asyncio
 import os
+import shutil
 import signal
 from pathlib import Path
 
@@ -10,12 +11,23 @@
 from ert.scheduler.event import FinishedEvent, StartedEvent
 from ert.scheduler.local_driver import LocalDriver
 
+TOUCH = shutil.which("touch")
+SLEEP = shutil.which("sleep")
+BASH = shutil.which("bash")
+TRUE = shutil.which("true")
+FALSE = shutil.which("false")
+if None in {TOUCH, SLEEP, BASH, TRUE, FALSE}:
+    pytest.skip(
+        "The local driver tests need touch, sleep, bash, true and false on PATH",
+        allow_module_level=True,
+    )
+
 
 async def test_success(tmp_path):
     driver = LocalDriver()
 
     os.chdir(tmp_path)
-    await driver.submit(42, "/usr/bin/env", "touch", "testfile")
+    await driver.submit(42, TOUCH, "testfile")
     assert await driver.event_queue.get() == StartedEvent(iens=42)
     assert await driver.event_queue.get() == FinishedEvent(iens=42, returncode=0)
 
@@ -25,7 +37,7 @@ async def test_success(tmp_path):
 async def test_failure():
     driver = LocalDriver()
 
-    await driver.submit(42, "/usr/bin/env", "false")
+    await driver.submit(42, FALSE)
     assert await driver.event_queue.get() == StartedEvent(iens=42)
     assert await driver.event_queue.get() == FinishedEvent(iens=42, returncode=1)
 
@@ -41,7 +53,7 @@ async def test_file_not_found():
 async def test_kill_while_running():
     driver = LocalDriver()
 
-    await driver.submit(42, "/usr/bin/env", "sleep", "10")
+    await driver.submit(42, SLEEP, "10")
     assert await driver.event_queue.get() == StartedEvent(iens=42)
     await driver.kill(42)
     assert await driver.event_queue.get() == FinishedEvent(
@@ -56,7 +68,7 @@ async def test_kill_while_running():
 async def test_kill_before_running(sleep_before_killing):
     driver = LocalDriver()
 
-    await driver.submit(42, "/usr/bin/env", "sleep", "10")
+    await driver.submit(42, SLEEP, "10")
     if sleep_before_killing is not None:
         await asyncio.sleep(sleep_before_killing)
     await driver.kill(42)
@@ -90,7 +102,7 @@ async def test_kill_unresponsive_process(monkeypatch, tmp_path):
 
     driver = LocalDriver()
 
-    await driver.submit(42, "/usr/bin/env", "bash", str(tmp_path / "script"))
+    await driver.submit(42, BASH, str(tmp_path / "script"))
     assert await driver.event_queue.get() == StartedEvent(iens=42)
 
     # Allow the script to trap signals
@@ -103,11 +115,13 @@ async def test_kill_unresponsive_process(monkeypatch, tmp_path):
 
 
 @pytest.mark.integration_test
-@pytest.mark.parametrize("cmd,returncode", [("true", 0), ("false", 1)])
+@pytest.mark.parametrize(
+    "cmd,returncode", [(TRUE, 0), (FALSE, 1)], ids=["true", "false"]
+)
 async def test_kill_when_job_completed(cmd, returncode):
     driver = LocalDriver()
 
-    await driver.submit(42, "/usr/bin/env", cmd)
+    await driver.submit(42, cmd)
     assert await driver.event_queue.get() == StartedEvent(iens=42)
     await asyncio.sleep(0.5)
     await driver.kill(42)
@@ -118,7 +132,7 @@ async def test_kill_when_job_completed(cmd, returncode):
 
 async def test_that_killing_killed_job_does_not_raise():
     driver = LocalDriver()
-    await driver.submit(23, "/usr/bin/env", "sleep", "10")
+    await driver.submit(23, SLEEP, "10")
     assert await driver.event_queue.get() == StartedEvent(iens=23)
     await driver.kill(23)
     assert await driver.event_queue.get() == FinishedEvent(
@@ -136,7 +150,7 @@ async def test_path_as_argument_is_valid(tmp_path):
     driver = LocalDriver()
     os.chdir(tmp_path)
 
-    await driver.submit(42, "/usr/bin/env", "touch", Path(tmp_path) / "testfile")
+    await driver.submit(42, TOUCH, Path(tmp_path) / "testfile")
     assert await driver.event_queue.get() == StartedEvent(iens=42)
     assert await driver.event_queue.get() == FinishedEvent(iens=42, returncode=0)
 
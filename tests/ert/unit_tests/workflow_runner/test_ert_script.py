@@ -45,26 +45,21 @@ def test_ert_script_from_file():
     assert subtract_script.initializeAndRun([int, int], ["1", "2"]) == -1
 
 
-@pytest.mark.usefixtures("use_tmpdir")
-def test_ert_script_with_syntax_error_raises_value_error():
-    with open("syntax_error_script.py", "w", encoding="utf-8") as f:
-        f.write("from ert not_legal_syntax ErtScript\n")
-    with pytest.raises(ValueError, match=r"ErtScript .*.py contains syntax error"):
-        _ = ErtScript.loadScriptFromFile("syntax_error_script.py")
-
-
-@pytest.mark.usefixtures("use_tmpdir")
-def test_ert_script_with_import_error_raises_value_error():
-    with open("import_error_script.py", "w", encoding="utf-8") as f:
-        f.write("from ert import DoesNotExist\n")
-    with pytest.raises(ValueError, match="cannot import name 'DoesNotExist'"):
-        _ = ErtScript.loadScriptFromFile("import_error_script.py")
-
-
-@pytest.mark.usefixtures("use_tmpdir")
-def test_empty_ert_script_raises_value_error():
-    with open("empty_script.py", "w", encoding="utf-8") as f:
-        f.write("from ert import ErtScript\n")
-
-    with pytest.raises(ValueError, match="does not contain an ErtScript"):
-        _ = ErtScript.loadScriptFromFile("empty_script.py")
+@pytest.mark.parametrize(
+    "script_contents, error_message",
+    [
+        (
+            "from ert not_legal_syntax ErtScript\n",
+            r"ErtScript .*.py contains syntax error",
+        ),
+        ("from ert import DoesNotExist\n", "cannot import name 'DoesNotExist'"),
+        ("from ert import ErtScript\n", "does not contain an ErtScript"),
+    ],
+)
+def test_invalid_ert_script_raises_value_error(
+    tmp_path, script_contents, error_message
+):
+    script_file = tmp_path / "invalid_script.py"
+    script_file.write_text(script_contents, encoding="utf-8")
+    with pytest.raises(ValueError, match=error_message):
+        _ = ErtScript.loadScriptFromFile(str(script_file))